@@ -10,6 +10,11 @@ from time import perf_counter_ns
 
 PACKAGE_NAME = "azusa"
 
+_VERSION_PATTERN = re.compile(
+    r'(^__version__\s*=\s*)"[^"]*"',
+    flags=re.MULTILINE,
+)
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -25,6 +30,10 @@ def update_version(root_dir: Path) -> str:
 
     Returns:
         The new version string in the form 'YYYY.M.D+tHHMMSS' (UTC).
+
+    Raises:
+        ValueError: If `__metadata__.py` does not contain exactly one
+            `__version__` assignment.
     """
     # get timestamped version string
     dt = datetime.datetime.now(tz=datetime.UTC)
@@ -32,12 +41,10 @@ def update_version(root_dir: Path) -> str:
     # update version
     config_file = root_dir / "src" / PACKAGE_NAME / "__metadata__.py"
     source = config_file.read_text(encoding="utf-8")
-    source = re.sub(
-        r"^__version__\s*=\s*.+$",
-        f'__version__ = "{version}"',
-        source,
-        flags=re.MULTILINE,
-    )
+    source, count = _VERSION_PATTERN.subn(rf'\g<1>"{version}"', source)
+    if count != 1:
+        msg = f"expected one __version__ assignment, found {count}"
+        raise ValueError(msg)
     config_file.write_text(source, encoding="utf-8")
     # return the version string
     return version
@@ -52,11 +59,16 @@ def remove_old_wheels(root_dir: Path, version: str) -> None:
     """
     logger = logging.getLogger(__name__)
     dist_dir = root_dir / "dist"
-    new_wheel = dist_dir / f"{PACKAGE_NAME}-{version}-py3-none-any.whl"
-    for wheel in dist_dir.glob(f"{PACKAGE_NAME}-*-py3-none-any.whl"):
-        if not wheel.samefile(new_wheel):
+    new_name = f"{PACKAGE_NAME}-{version}-py3-none-any.whl"
+    for wheel in dist_dir.iterdir():
+        name = wheel.name
+        if (
+            name != new_name
+            and name.startswith(f"{PACKAGE_NAME}-")
+            and name.endswith("-py3-none-any.whl")
+        ):
             wheel.unlink()
-            logger.info("removed old wheel %s", wheel.name)
+            logger.info("removed old wheel %s", name)
 
 
 def build_wheel(root_dir: Path, *, remove_old: bool) -> None:
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 import subprocess  # noqa: S404
 from pathlib import Path
 from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
-from packaging.utils import parse_wheel_filename
+from packaging.version import Version
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -32,8 +34,15 @@ def get_wheels(path: Path, pkg: str) -> list[Path]:
     Returns:
         A list of matching wheel file paths in ascending version order.
     """
-    wheels = list(path.glob(f"{pkg}-*-py3-none-any.whl"))
-    wheels.sort(key=lambda x: parse_wheel_filename(x.name)[1])
+    prefix = f"{pkg}-"
+    with os.scandir(path) as entries:
+        wheels = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith(prefix)
+            and entry.name.endswith("-py3-none-any.whl")
+        ]
+    wheels.sort(key=lambda x: Version(x.name.split("-")[1]))
     return wheels
 
 
@@ -58,7 +67,15 @@ def install_wheel(
     except IndexError:
         logger.warning("no wheels found")
         return
-    subprocess.run(("pip", "install", latest_wheel), check=True)  # noqa: S603
+    if shutil.which("uv") is not None:
+        # Unlike pip, uv targets a discovered venv by default; pass
+        # --system only when no venv is active so both branches
+        # install into the current environment.
+        system = () if "VIRTUAL_ENV" in os.environ else ("--system",)
+        command = ("uv", "pip", "install", *system, str(latest_wheel))
+    else:
+        command = ("pip", "install", str(latest_wheel))
+    subprocess.run(command, check=True)  # noqa: S603
     logger.info("installed %s", latest_wheel.name)
     if remove_old:
         for wheel in wheels:
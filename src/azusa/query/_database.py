@@ -20,14 +20,39 @@ from polars import DataType
 from sqlalchemy import Engine, Row, Select, create_engine, text
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
     from polars.datatypes import DataTypeClass
+    from sqlalchemy import RowMapping
     from sqlalchemy.engine.interfaces import DBAPIType
 
     from azusa.query._typing import PywikibotSite, Statement, StrMode
 
 
+_TYPE_CODE_MAP = MappingProxyType({
+    1: pl.datatypes.Int64,
+    2: pl.datatypes.Int64,
+    3: pl.datatypes.Int64,
+    4: pl.datatypes.Float64,
+    5: pl.datatypes.Float64,
+    6: pl.datatypes.Null,  # uncertain
+    7: pl.datatypes.Datetime,
+    8: pl.datatypes.Int64,
+    10: pl.datatypes.Date,
+    246: pl.datatypes.Decimal,
+})
+
+_STR_TYPE_CODES = frozenset({247, 248, 249, 250, 252, 253})
+
+_FETCH_CHUNK_SIZE = 10_000
+
+_STR_MODE_MAP = MappingProxyType({
+    "str": pl.datatypes.String,
+    "bytes": pl.datatypes.Binary,
+    "guess": pl.datatypes.Unknown,
+})
+
+
 class ColumnInfo(NamedTuple):
     """Container for database column metadata.
 
@@ -46,12 +71,12 @@ class RawQueryResult(TypedDict):
     Attributes:
         column_info: Tuple of ColumnInfo objects describing each
             column's metadata.
-        rows: Tuple of SQLAlchemy Row objects (tuples) containing
+        rows: List of SQLAlchemy Row objects (tuples) containing
             the query result data.
     """
 
     column_info: tuple[ColumnInfo, ...]
-    rows: tuple[Row[Any], ...]
+    rows: list[Row[Any]]
 
 
 def map_type_code(
@@ -70,32 +95,9 @@ def map_type_code(
     Returns:
         The corresponding Polars data type.
     """
-    mapping = MappingProxyType({
-        1: pl.datatypes.Int64,
-        2: pl.datatypes.Int64,
-        3: pl.datatypes.Int64,
-        4: pl.datatypes.Float64,
-        5: pl.datatypes.Float64,
-        6: pl.datatypes.Null,  # uncertain
-        7: pl.datatypes.Datetime,
-        8: pl.datatypes.Int64,
-        10: pl.datatypes.Date,
-        246: pl.datatypes.Decimal,
-        247: "STR_TYPE",
-        248: "STR_TYPE",
-        249: "STR_TYPE",
-        250: "STR_TYPE",
-        252: "STR_TYPE",
-        253: "STR_TYPE",
-    })
-    if (result := mapping.get(code, pl.datatypes.Unknown)) != "STR_TYPE":
-        return result
-    match str_mode:
-        case "str":
-            return pl.datatypes.String
-        case "bytes":
-            return pl.datatypes.Binary
-    return pl.datatypes.Unknown
+    if code not in _STR_TYPE_CODES:
+        return _TYPE_CODE_MAP.get(code, pl.datatypes.Unknown)
+    return _STR_MODE_MAP.get(str_mode, pl.datatypes.Unknown)
 
 
 class Database:
@@ -131,10 +133,13 @@ class Database:
             extension: Extension database name (e.g., 'termstore' for
                 'wikidatawiki').
         """
+        if hasattr(self, "_engine"):
+            # Cached instance returned by __new__; already initialized.
+            return
         self.project = project
         self.extension = extension
         self.host = self._construct_host()
-        self._engine = self._create_engine()
+        self._engine: Engine | None = None
 
     def _construct_host(self) -> str:
         """Build database host identifier.
@@ -162,7 +167,20 @@ class Database:
             "read_default_file": ".my.cnf",
         }
         uri = f"mysql+pymysql://?{urlencode(uri_params)}"
-        return create_engine(uri)
+        return create_engine(uri, insertmanyvalues_page_size=10_000)
+
+    def _get_engine(self) -> Engine:
+        """Return the database engine, creating it on first use.
+
+        Deferring engine creation avoids allocating a connection pool
+        for instances that only build statements offline.
+
+        Returns:
+            SQLAlchemy engine instance configured for this database.
+        """
+        if self._engine is None:
+            self._engine = self._create_engine()
+        return self._engine
 
     def fetch_raw(self, __stmt: Statement, /) -> RawQueryResult:
         """Execute a raw SQL statement and return raw data.
@@ -174,16 +192,17 @@ class Database:
         Returns:
             A dictionary containing column metadata and the result set.
             The column metadata is represented as a tuple of ColumnInfo
-            objects, and the result set is a tuple of Row objects.
+            objects, and the result set is a list of Row objects.
         """
         stmt = text(__stmt) if isinstance(__stmt, str) else __stmt
-        with self._engine.connect() as connection, connection.begin():
+        with self._get_engine().connect() as connection, connection.begin():
             result = connection.execute(stmt)
-            column_info = tuple(
-                ColumnInfo(name=x[0], type_code=x[1])
-                for x in result.cursor.description
+            names, type_codes, *_ = zip(
+                *result.cursor.description,
+                strict=True,
             )
-            rows = tuple(result.fetchall())
+            column_info = tuple(map(ColumnInfo, names, type_codes))
+            rows = result.fetchall()
         return RawQueryResult(column_info=column_info, rows=rows)
 
     def fetch(
@@ -195,9 +214,11 @@ class Database:
     ) -> pl.DataFrame:
         """Execute a raw SQL statement and return a Polars DataFrame.
 
-        This method executes a statement to retrieve raw data, maps the
-        data types according to the given or inferred string mode, and
-        returns the query result as a DataFrame.
+        This method streams the result set from a server-side cursor in
+        chunks of ``_FETCH_CHUNK_SIZE`` rows, maps the data types
+        according to the given or inferred string mode, and returns the
+        query result as a DataFrame. Peak memory is bounded by the chunk
+        size rather than the total row count.
 
         Args:
             __stmt: The SQL-like statement used to fetch data.
@@ -215,18 +236,68 @@ class Database:
             str_mode_ = "str" if isinstance(__stmt, Select) else "bytes"
         else:
             str_mode_ = str_mode
-        raw_data = self.fetch_raw(__stmt)
-        schema = [
-            (col.name, map_type_code(col.type_code, str_mode_))
-            for col in raw_data["column_info"]
-        ]
-        lf = pl.LazyFrame(
-            raw_data["rows"],
-            schema,
-            schema_overrides=schema_overrides,
-            orient="row",
-        )
-        return lf.collect()
+        stmt = text(__stmt) if isinstance(__stmt, str) else __stmt
+        with self._get_engine().connect() as connection, connection.begin():
+            result = connection.execution_options(
+                stream_results=True,
+            ).execute(stmt)
+            names, type_codes, *_ = zip(
+                *result.cursor.description,
+                strict=True,
+            )
+            schema = dict(
+                zip(
+                    names,
+                    (map_type_code(c, str_mode_) for c in type_codes),
+                    strict=True,
+                )
+            )
+            frames = [
+                pl.DataFrame(
+                    chunk,
+                    schema,
+                    schema_overrides=schema_overrides,
+                    orient="row",
+                )
+                for chunk in result.partitions(_FETCH_CHUNK_SIZE)
+            ]
+        if not frames:
+            return pl.DataFrame(
+                schema=schema,
+                schema_overrides=schema_overrides,
+            )
+        if len(frames) == 1:
+            return frames[0]
+        return pl.concat(frames, rechunk=True)
+
+    def scan(
+        self,
+        __stmt: Statement,
+        /,
+        chunk_size: int = _FETCH_CHUNK_SIZE,
+    ) -> Iterator[RowMapping]:
+        """Execute a statement and lazily yield mapping-style rows.
+
+        Rows are streamed from a server-side cursor in chunks of
+        ``chunk_size``, so memory stays bounded regardless of the total
+        result size. Each row is a SQLAlchemy RowMapping, hydrated by
+        Core without any ORM instance bookkeeping — suited to bulk
+        scans that do not need a DataFrame.
+
+        Args:
+            __stmt: The SQL-like statement used to fetch data.
+            chunk_size: The number of rows to buffer per round trip.
+
+        Yields:
+            One RowMapping per result row, keyed by column name.
+        """
+        stmt = text(__stmt) if isinstance(__stmt, str) else __stmt
+        with self._get_engine().connect() as connection, connection.begin():
+            result = connection.execution_options(
+                stream_results=True,
+            ).execute(stmt)
+            for partition in result.mappings().partitions(chunk_size):
+                yield from partition
 
     @classmethod
     def from_site(
@@ -20,8 +20,6 @@ from azusa.query.tables import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-
     from sqlalchemy import BinaryExpression, Select
     from sqlalchemy.orm import InstrumentedAttribute
 
@@ -39,12 +37,12 @@ def _generate_where_clause(
     Returns:
         Union: A condition representing the filter condition.
     """
-    if isinstance(value, str):
-        return column.op("=")(value)
-    try:
-        return column.in_(set(value))
-    except TypeError:
+    if isinstance(value, str) or not isinstance(value, Iterable):
         return column.op("=")(value)
+    values = tuple(value)
+    if len(values) == 1:
+        return column.op("=")(values[0])
+    return column.in_(values)
 
 
 def where_clauses(
@@ -111,14 +109,16 @@ def query_pages_by_wikiproject(
         Pa.pa_class,
         Pa.pa_importance,
     ]
-    conditions = [
-        (Pap.pap_project_title, __name),
-        (Pa.pa_class, quality),
-        (Pa.pa_importance, priority),
-    ]
+    clauses = []
+    if __name is not None:
+        clauses.append(_generate_where_clause(Pap.pap_project_title, __name))
+    if quality is not None:
+        clauses.append(_generate_where_clause(Pa.pa_class, quality))
+    if priority is not None:
+        clauses.append(_generate_where_clause(Pa.pa_importance, priority))
     return (
         select(*fields)
-        .where(*where_clauses(conditions))
+        .where(*clauses)
         .select_from(Pap)
         .join(Pa, Pap.pap_project_id == Pa.pa_project_id)
         .join(Page, Pa.pa_page_id == Page.page_id)
@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
-from datetime import datetime  # noqa: TC003
-from decimal import Decimal  # noqa: TC003
-from types import MappingProxyType
-
-from sqlalchemy import Dialect, LargeBinary, TypeDecorator
+from codecs import ascii_decode, utf_8_decode
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Dialect,
+    Index,
+    LargeBinary,
+    Numeric,
+    SmallInteger,
+    TypeDecorator,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped as Col, mapped_column as col
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from decimal import Decimal
+
 __all__ = (
     "Actor",
     "Archive",
@@ -85,10 +98,6 @@ __all__ = (
 )
 
 
-class Base(DeclarativeBase):
-    """The Base class of ORM definitions."""
-
-
 class BinaryDecoder(TypeDecorator):
     """An SQLAlchemy type decorator for processing text-type values.
 
@@ -100,12 +109,7 @@ class BinaryDecoder(TypeDecorator):
 
     cache_ok = True
 
-    _encoding_config = MappingProxyType({
-        "encoding": "utf-8",
-        "errors": "backslashreplace",
-    })
-
-    def process_bind_param(
+    def process_bind_param(  # noqa: PLR6301
         self,
         value: str | None,
         dialect: Dialect,  # noqa: ARG002
@@ -121,9 +125,59 @@ class BinaryDecoder(TypeDecorator):
         """
         if value is None:
             return None
-        return value.encode(**self._encoding_config)
+        return value.encode("utf-8", "backslashreplace")
+
+    def bind_processor(  # noqa: PLR6301
+        self,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> Callable[[str | None], bytes | None]:
+        """Return a flat per-statement bind processor.
+
+        SQLAlchemy calls this once per statement and reuses the
+        returned callable for every bound value, hoisting the
+        TypeDecorator dispatch out of the per-row loop. A nullable
+        specialization is not possible here because the processor has
+        no column context, so the None check stays.
+
+        Args:
+            dialect: The database dialect.
 
-    def process_result_value(
+        Returns:
+            A callable encoding one bound value.
+        """
+
+        def process(value: str | None) -> bytes | None:
+            if value is None:
+                return None
+            return value.encode("utf-8", "backslashreplace")
+
+        return process
+
+    def literal_processor(  # noqa: PLR6301
+        self,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> Callable[[str], str]:
+        """Return a processor rendering values as inline SQL literals.
+
+        Letting decoded columns render literally means statements
+        compiled with ``literal_execute`` keep their cached SQL instead
+        of re-encoding the bound string on every execution. Only quotes
+        are doubled here; dialects that treat backslashes as escapes
+        (MySQL/MariaDB) double them in their own rendering pass.
+
+        Args:
+            dialect: The database dialect.
+
+        Returns:
+            A callable quoting one value for inline SQL.
+        """
+
+        def process(value: str) -> str:
+            return "'" + value.replace("'", "''") + "'"
+
+        return process
+
+    def process_result_value(  # noqa: PLR6301
         self,
         value: bytes | None,
         dialect: Dialect,  # noqa: ARG002
@@ -139,7 +193,186 @@ class BinaryDecoder(TypeDecorator):
         """
         if value is None:
             return None
-        return value.decode(**self._encoding_config)
+        try:
+            return utf_8_decode(value, "strict", True)[0]  # noqa: FBT003
+        except UnicodeDecodeError:
+            return utf_8_decode(
+                value,
+                "backslashreplace",
+                True,  # noqa: FBT003
+            )[0]
+
+    def result_processor(  # noqa: PLR6301
+        self,
+        dialect: Dialect,  # noqa: ARG002
+        coltype: object,  # noqa: ARG002
+    ) -> Callable[[bytes | None], str | None]:
+        """Return a flat per-column result processor.
+
+        SQLAlchemy calls this once per statement column and reuses the
+        returned callable for every row, so the closure skips the
+        TypeDecorator dispatch that would otherwise route each cell
+        through :meth:`process_result_value`.
+
+        Args:
+            dialect: The database dialect.
+            coltype: The DBAPI column type.
+
+        Returns:
+            A callable decoding one raw cell value.
+        """
+
+        def process(value: bytes | None) -> str | None:
+            if value is None:
+                return None
+            try:
+                return utf_8_decode(value, "strict", True)[0]  # noqa: FBT003
+            except UnicodeDecodeError:
+                return utf_8_decode(
+                    value,
+                    "backslashreplace",
+                    True,  # noqa: FBT003
+                )[0]
+
+        return process
+
+    def decode_column(
+        self,
+        values: Iterable[bytes | None],
+    ) -> list[str | None]:
+        """Decode a whole column of raw values in one pass.
+
+        Intended for callers that fetch raw rows (e.g. ``fetch_raw``)
+        and decode columns themselves: the processor closure is built
+        once and applied with :func:`map`, so the per-cell cost is one
+        C-level call rather than a TypeDecorator dispatch per value.
+
+        Args:
+            values: The raw binary cells of one column.
+
+        Returns:
+            A list of decoded strings, preserving None entries.
+        """
+        # Both arguments are unused by the returned closure.
+        process = self.result_processor(None, None)  # type: ignore[arg-type]
+        return list(map(process, values))
+
+
+class AsciiBinaryDecoder(BinaryDecoder):
+    """A BinaryDecoder variant for columns holding pure-ASCII values.
+
+    Timestamps, SHA-1 digests, hex addresses, MIME parts, and similar
+    columns never contain multi-byte sequences, so results take the
+    cheaper ASCII codec and only fall back to UTF-8 on foreign bytes.
+    """
+
+    cache_ok = True
+
+    def process_result_value(  # noqa: PLR6301
+        self,
+        value: bytes | None,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> str | None:
+        """Process bytes values obtained from a query.
+
+        Args:
+            value: The binary value to decode.
+            dialect: The database dialect.
+
+        Returns:
+            The decoded string value or None if the input value is None.
+        """
+        if value is None:
+            return None
+        try:
+            return ascii_decode(value)[0]
+        except UnicodeDecodeError:
+            return utf_8_decode(
+                value,
+                "backslashreplace",
+                True,  # noqa: FBT003
+            )[0]
+
+    def result_processor(  # noqa: PLR6301
+        self,
+        dialect: Dialect,  # noqa: ARG002
+        coltype: object,  # noqa: ARG002
+    ) -> Callable[[bytes | None], str | None]:
+        """Return a flat per-column result processor.
+
+        Args:
+            dialect: The database dialect.
+            coltype: The DBAPI column type.
+
+        Returns:
+            A callable decoding one raw cell value.
+        """
+
+        def process(value: bytes | None) -> str | None:
+            if value is None:
+                return None
+            try:
+                return ascii_decode(value)[0]
+            except UnicodeDecodeError:
+                return utf_8_decode(
+                    value,
+                    "backslashreplace",
+                    True,  # noqa: FBT003
+                )[0]
+
+        return process
+
+
+class UnsignedBigInt(TypeDecorator):
+    """An SQLAlchemy type decorator for unsigned big-integer columns.
+
+    MediaWiki declares some unsigned BIGINT ids as ``DECIMAL(20,0)``,
+    so the driver hands them back as Decimal even though nothing
+    fractional is ever stored. Results are coerced to plain int.
+    """
+
+    impl = Numeric(20, 0)
+
+    cache_ok = True
+
+    def process_result_value(  # noqa: PLR6301
+        self,
+        value: Decimal | None,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> int | None:
+        """Process Decimal values obtained from a query.
+
+        Args:
+            value: The decimal value to coerce.
+            dialect: The database dialect.
+
+        Returns:
+            The integer value or None if the input value is None.
+        """
+        if value is None:
+            return None
+        return int(value)
+
+
+_BINARY_DECODER = BinaryDecoder()
+
+_ASCII_DECODER = AsciiBinaryDecoder()
+
+_UNSIGNED_BIGINT = UnsignedBigInt()
+
+
+class Base(DeclarativeBase):
+    """The Base class of ORM definitions.
+
+    The annotation map lets plain ``Col[...]`` annotations declare
+    columns without a ``col()`` call; ``str`` columns default to the
+    shared BinaryDecoder instance.
+    """
+
+    type_annotation_map = {  # noqa: RUF012
+        str: _BINARY_DECODER,
+        datetime: DateTime,
+    }
 
 
 class Actor(Base):
@@ -152,9 +385,9 @@ class Actor(Base):
     """
 
     __tablename__ = "actor"
-    actor_id: Col[int] = col(primary_key=True)
-    actor_user: Col[int] = col()
-    actor_name: Col[str] = col(BinaryDecoder)
+    actor_id: Col[int] = col(BigInteger, primary_key=True)
+    actor_user: Col[int]
+    actor_name: Col[str]
 
 
 class Archive(Base):
@@ -165,7 +398,7 @@ class Archive(Base):
         ar_namespace: ``int``
         ar_title: ``str``
         ar_comment_id: ``int``
-        ar_actor: ``Decimal``
+        ar_actor: ``int``
         ar_timestamp: ``str``
         ar_minor_edit: ``int``
         ar_rev_id: ``int``
@@ -178,18 +411,26 @@ class Archive(Base):
 
     __tablename__ = "archive"
     ar_id: Col[int] = col(primary_key=True)
-    ar_namespace: Col[int] = col()
-    ar_title: Col[str] = col(BinaryDecoder)
-    ar_comment_id: Col[int] = col()
-    ar_actor: Col[Decimal] = col()
-    ar_timestamp: Col[str] = col(BinaryDecoder)
-    ar_minor_edit: Col[int] = col()
-    ar_rev_id: Col[int] = col()
-    ar_deleted: Col[int] = col()
-    ar_len: Col[int] = col()
-    ar_page_id: Col[int] = col()
-    ar_parent_id: Col[int] = col()
-    ar_sha1: Col[str] = col(BinaryDecoder)
+    ar_namespace: Col[int]
+    ar_title: Col[str]
+    ar_comment_id: Col[int]
+    ar_actor: Col[int] = col(_UNSIGNED_BIGINT)
+    ar_timestamp: Col[str] = col(_ASCII_DECODER)
+    ar_minor_edit: Col[int] = col(SmallInteger)
+    ar_rev_id: Col[int]
+    ar_deleted: Col[int] = col(SmallInteger)
+    ar_len: Col[int]
+    ar_page_id: Col[int]
+    ar_parent_id: Col[int]
+    ar_sha1: Col[str] = col(_ASCII_DECODER)
+    __table_args__ = (
+        Index(
+            "name_title_timestamp",
+            "ar_namespace",
+            "ar_title",
+            "ar_timestamp",
+        ),
+    )
 
 
 class Block(Base):
@@ -214,19 +455,19 @@ class Block(Base):
 
     __tablename__ = "block"
     bl_id: Col[int] = col(primary_key=True)
-    bl_target: Col[int] = col()
-    bl_by_actor: Col[int] = col()
-    bl_reason_id: Col[int] = col()
-    bl_timestamp: Col[str] = col(BinaryDecoder)
-    bl_anon_only: Col[int] = col()
-    bl_create_account: Col[int] = col()
-    bl_enable_autoblock: Col[int] = col()
-    bl_expiry: Col[str] = col(BinaryDecoder)
-    bl_deleted: Col[int] = col()
-    bl_block_email: Col[int] = col()
-    bl_allow_usertalk: Col[int] = col()
-    bl_parent_block_id: Col[int] = col()
-    bl_sitewide: Col[int] = col()
+    bl_target: Col[int]
+    bl_by_actor: Col[int]
+    bl_reason_id: Col[int]
+    bl_timestamp: Col[str] = col(_ASCII_DECODER)
+    bl_anon_only: Col[int] = col(SmallInteger)
+    bl_create_account: Col[int] = col(SmallInteger)
+    bl_enable_autoblock: Col[int] = col(SmallInteger)
+    bl_expiry: Col[str]
+    bl_deleted: Col[int] = col(SmallInteger)
+    bl_block_email: Col[int] = col(SmallInteger)
+    bl_allow_usertalk: Col[int] = col(SmallInteger)
+    bl_parent_block_id: Col[int]
+    bl_sitewide: Col[int] = col(SmallInteger)
 
 
 class BlockTarget(Base):
@@ -246,14 +487,14 @@ class BlockTarget(Base):
 
     __tablename__ = "block_target"
     bt_id: Col[int] = col(primary_key=True)
-    bt_address: Col[str] = col(BinaryDecoder)
-    bt_user: Col[int] = col()
-    bt_user_text: Col[str] = col(BinaryDecoder)
-    bt_auto: Col[int] = col()
-    bt_range_start: Col[str] = col(BinaryDecoder)
-    bt_range_end: Col[str] = col(BinaryDecoder)
-    bt_ip_hex: Col[str] = col(BinaryDecoder)
-    bt_count: Col[int] = col()
+    bt_address: Col[str]
+    bt_user: Col[int]
+    bt_user_text: Col[str]
+    bt_auto: Col[int]
+    bt_range_start: Col[str]
+    bt_range_end: Col[str]
+    bt_ip_hex: Col[str] = col(_ASCII_DECODER)
+    bt_count: Col[int]
 
 
 class BotPasswords(Base):
@@ -270,11 +511,11 @@ class BotPasswords(Base):
 
     __tablename__ = "bot_passwords"
     bp_user: Col[int] = col(primary_key=True)
-    bp_app_id: Col[str] = col(BinaryDecoder, primary_key=True)
-    bp_password: Col[str] = col(BinaryDecoder)
-    bp_token: Col[str] = col(BinaryDecoder)
-    bp_restrictions: Col[str] = col(BinaryDecoder)
-    bp_grants: Col[str] = col(BinaryDecoder)
+    bp_app_id: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    bp_password: Col[str]
+    bp_token: Col[str]
+    bp_restrictions: Col[str]
+    bp_grants: Col[str]
 
 
 class Category(Base):
@@ -290,10 +531,10 @@ class Category(Base):
 
     __tablename__ = "category"
     cat_id: Col[int] = col(primary_key=True)
-    cat_title: Col[str] = col(BinaryDecoder)
-    cat_pages: Col[int] = col()
-    cat_subcats: Col[int] = col()
-    cat_files: Col[int] = col()
+    cat_title: Col[str]
+    cat_pages: Col[int]
+    cat_subcats: Col[int]
+    cat_files: Col[int]
 
 
 class Categorylinks(Base):
@@ -311,12 +552,13 @@ class Categorylinks(Base):
 
     __tablename__ = "categorylinks"
     cl_from: Col[int] = col(primary_key=True)
-    cl_to: Col[str] = col(BinaryDecoder, primary_key=True)
-    cl_sortkey: Col[str] = col(BinaryDecoder)
-    cl_sortkey_prefix: Col[str] = col(BinaryDecoder)
-    cl_timestamp: Col[datetime] = col()
-    cl_collation: Col[str] = col(BinaryDecoder)
-    cl_type: Col[str] = col(BinaryDecoder)
+    cl_to: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    cl_sortkey: Col[str]
+    cl_sortkey_prefix: Col[str]
+    cl_timestamp: Col[datetime]
+    cl_collation: Col[str]
+    cl_type: Col[str]
+    __table_args__ = (Index("cl_sortkey", "cl_to", "cl_sortkey"),)
 
 
 class ChangeTag(Base):
@@ -333,11 +575,11 @@ class ChangeTag(Base):
 
     __tablename__ = "change_tag"
     ct_id: Col[int] = col(primary_key=True)
-    ct_rc_id: Col[int] = col()
-    ct_log_id: Col[int] = col()
-    ct_rev_id: Col[int] = col()
-    ct_params: Col[str] = col(BinaryDecoder)
-    ct_tag_id: Col[int] = col()
+    ct_rc_id: Col[int]
+    ct_log_id: Col[int]
+    ct_rev_id: Col[int]
+    ct_params: Col[str]
+    ct_tag_id: Col[int]
 
 
 class ChangeTagDef(Base):
@@ -352,9 +594,9 @@ class ChangeTagDef(Base):
 
     __tablename__ = "change_tag_def"
     ctd_id: Col[int] = col(primary_key=True)
-    ctd_name: Col[str] = col(BinaryDecoder)
-    ctd_user_defined: Col[int] = col()
-    ctd_count: Col[int] = col()
+    ctd_name: Col[str] = col(_ASCII_DECODER)
+    ctd_user_defined: Col[int] = col(SmallInteger)
+    ctd_count: Col[int]
 
 
 class Comment(Base):
@@ -369,9 +611,9 @@ class Comment(Base):
 
     __tablename__ = "comment"
     comment_id: Col[int] = col(primary_key=True)
-    comment_hash: Col[int] = col()
-    comment_text: Col[str] = col(BinaryDecoder)
-    comment_data: Col[str] = col(BinaryDecoder)
+    comment_hash: Col[int]
+    comment_text: Col[str]
+    comment_data: Col[str]
 
 
 class Content(Base):
@@ -387,10 +629,10 @@ class Content(Base):
 
     __tablename__ = "content"
     content_id: Col[int] = col(primary_key=True)
-    content_size: Col[int] = col()
-    content_sha1: Col[str] = col(BinaryDecoder)
-    content_model: Col[int] = col()
-    content_address: Col[str] = col(BinaryDecoder)
+    content_size: Col[int]
+    content_sha1: Col[str] = col(_ASCII_DECODER)
+    content_model: Col[int]
+    content_address: Col[str]
 
 
 class ContentModels(Base):
@@ -403,7 +645,7 @@ class ContentModels(Base):
 
     __tablename__ = "content_models"
     model_id: Col[int] = col(primary_key=True)
-    model_name: Col[str] = col(BinaryDecoder)
+    model_name: Col[str] = col(_ASCII_DECODER)
 
 
 class Externallinks(Base):
@@ -418,9 +660,9 @@ class Externallinks(Base):
 
     __tablename__ = "externallinks"
     el_id: Col[int] = col(primary_key=True)
-    el_from: Col[int] = col()
-    el_to_domain_index: Col[str] = col(BinaryDecoder)
-    el_to_path: Col[str] = col(BinaryDecoder)
+    el_from: Col[int]
+    el_to_domain_index: Col[str]
+    el_to_path: Col[str]
 
 
 class Filearchive(Base):
@@ -443,7 +685,7 @@ class Filearchive(Base):
         fa_media_type: ``str``
         fa_major_mime: ``str``
         fa_minor_mime: ``str``
-        fa_description_id: ``Decimal``
+        fa_description_id: ``int``
         fa_actor: ``int``
         fa_timestamp: ``str``
         fa_deleted: ``int``
@@ -452,26 +694,26 @@ class Filearchive(Base):
 
     __tablename__ = "filearchive"
     fa_id: Col[int] = col(primary_key=True)
-    fa_name: Col[str] = col(BinaryDecoder)
-    fa_archive_name: Col[str] = col(BinaryDecoder)
-    fa_storage_group: Col[str] = col(BinaryDecoder)
-    fa_storage_key: Col[str] = col(BinaryDecoder)
-    fa_deleted_user: Col[int] = col()
-    fa_deleted_timestamp: Col[str] = col(BinaryDecoder)
-    fa_deleted_reason_id: Col[int] = col()
-    fa_size: Col[int] = col()
-    fa_width: Col[int] = col()
-    fa_height: Col[int] = col()
-    fa_metadata: Col[str] = col(BinaryDecoder)
-    fa_bits: Col[int] = col()
-    fa_media_type: Col[str] = col(BinaryDecoder)
-    fa_major_mime: Col[str] = col(BinaryDecoder)
-    fa_minor_mime: Col[str] = col(BinaryDecoder)
-    fa_description_id: Col[Decimal] = col()
-    fa_actor: Col[int] = col()
-    fa_timestamp: Col[str] = col(BinaryDecoder)
-    fa_deleted: Col[int] = col()
-    fa_sha1: Col[str] = col(BinaryDecoder)
+    fa_name: Col[str]
+    fa_archive_name: Col[str]
+    fa_storage_group: Col[str]
+    fa_storage_key: Col[str]
+    fa_deleted_user: Col[int]
+    fa_deleted_timestamp: Col[str] = col(_ASCII_DECODER)
+    fa_deleted_reason_id: Col[int]
+    fa_size: Col[int]
+    fa_width: Col[int]
+    fa_height: Col[int]
+    fa_metadata: Col[str]
+    fa_bits: Col[int]
+    fa_media_type: Col[str]
+    fa_major_mime: Col[str] = col(_ASCII_DECODER)
+    fa_minor_mime: Col[str] = col(_ASCII_DECODER)
+    fa_description_id: Col[int] = col(_UNSIGNED_BIGINT)
+    fa_actor: Col[int]
+    fa_timestamp: Col[str] = col(_ASCII_DECODER)
+    fa_deleted: Col[int] = col(SmallInteger)
+    fa_sha1: Col[str] = col(_ASCII_DECODER)
 
 
 class Image(Base):
@@ -487,26 +729,26 @@ class Image(Base):
         img_media_type: ``str``
         img_major_mime: ``str``
         img_minor_mime: ``str``
-        img_description_id: ``Decimal``
+        img_description_id: ``int``
         img_actor: ``int``
         img_timestamp: ``str``
         img_sha1: ``str``
     """
 
     __tablename__ = "image"
-    img_name: Col[str] = col(BinaryDecoder, primary_key=True)
-    img_size: Col[int] = col()
-    img_width: Col[int] = col()
-    img_height: Col[int] = col()
-    img_metadata: Col[str] = col(BinaryDecoder)
-    img_bits: Col[int] = col()
-    img_media_type: Col[str] = col(BinaryDecoder)
-    img_major_mime: Col[str] = col(BinaryDecoder)
-    img_minor_mime: Col[str] = col(BinaryDecoder)
-    img_description_id: Col[Decimal] = col()
-    img_actor: Col[int] = col()
-    img_timestamp: Col[str] = col(BinaryDecoder)
-    img_sha1: Col[str] = col(BinaryDecoder)
+    img_name: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    img_size: Col[int]
+    img_width: Col[int]
+    img_height: Col[int]
+    img_metadata: Col[str]
+    img_bits: Col[int]
+    img_media_type: Col[str]
+    img_major_mime: Col[str] = col(_ASCII_DECODER)
+    img_minor_mime: Col[str] = col(_ASCII_DECODER)
+    img_description_id: Col[int] = col(_UNSIGNED_BIGINT)
+    img_actor: Col[int]
+    img_timestamp: Col[str] = col(_ASCII_DECODER)
+    img_sha1: Col[str] = col(_ASCII_DECODER)
 
 
 class Imagelinks(Base):
@@ -520,8 +762,8 @@ class Imagelinks(Base):
 
     __tablename__ = "imagelinks"
     il_from: Col[int] = col(primary_key=True)
-    il_from_namespace: Col[int] = col()
-    il_to: Col[str] = col(BinaryDecoder, primary_key=True)
+    il_from_namespace: Col[int]
+    il_to: Col[str] = col(_BINARY_DECODER, primary_key=True)
 
 
 class Interwiki(Base):
@@ -537,12 +779,12 @@ class Interwiki(Base):
     """
 
     __tablename__ = "interwiki"
-    iw_prefix: Col[str] = col(BinaryDecoder, primary_key=True)
-    iw_url: Col[str] = col(BinaryDecoder)
-    iw_api: Col[str] = col(BinaryDecoder)
-    iw_wikiid: Col[str] = col(BinaryDecoder)
-    iw_local: Col[int] = col()
-    iw_trans: Col[int] = col()
+    iw_prefix: Col[str] = col(_ASCII_DECODER, primary_key=True)
+    iw_url: Col[str]
+    iw_api: Col[str]
+    iw_wikiid: Col[str]
+    iw_local: Col[int] = col(SmallInteger)
+    iw_trans: Col[int] = col(SmallInteger)
 
 
 class IpChanges(Base):
@@ -556,8 +798,8 @@ class IpChanges(Base):
 
     __tablename__ = "ip_changes"
     ipc_rev_id: Col[int] = col(primary_key=True)
-    ipc_rev_timestamp: Col[str] = col(BinaryDecoder)
-    ipc_hex: Col[str] = col(BinaryDecoder)
+    ipc_rev_timestamp: Col[str] = col(_ASCII_DECODER)
+    ipc_hex: Col[str] = col(_ASCII_DECODER)
 
 
 class Ipblocks(Base):
@@ -586,23 +828,23 @@ class Ipblocks(Base):
 
     __tablename__ = "ipblocks"
     ipb_id: Col[int] = col(primary_key=True)
-    ipb_address: Col[str] = col(BinaryDecoder)
-    ipb_user: Col[int] = col()
-    ipb_by_actor: Col[int] = col()
-    ipb_reason_id: Col[int] = col()
-    ipb_timestamp: Col[str] = col(BinaryDecoder)
-    ipb_auto: Col[int] = col()
-    ipb_anon_only: Col[int] = col()
-    ipb_create_account: Col[int] = col()
-    ipb_enable_autoblock: Col[int] = col()
-    ipb_expiry: Col[str] = col(BinaryDecoder)
-    ipb_range_start: Col[str] = col(BinaryDecoder)
-    ipb_range_end: Col[str] = col(BinaryDecoder)
-    ipb_deleted: Col[int] = col()
-    ipb_block_email: Col[int] = col()
-    ipb_allow_usertalk: Col[int] = col()
-    ipb_parent_block_id: Col[int] = col()
-    ipb_sitewide: Col[int] = col()
+    ipb_address: Col[str]
+    ipb_user: Col[int]
+    ipb_by_actor: Col[int]
+    ipb_reason_id: Col[int]
+    ipb_timestamp: Col[str] = col(_ASCII_DECODER)
+    ipb_auto: Col[int] = col(SmallInteger)
+    ipb_anon_only: Col[int] = col(SmallInteger)
+    ipb_create_account: Col[int] = col(SmallInteger)
+    ipb_enable_autoblock: Col[int] = col(SmallInteger)
+    ipb_expiry: Col[str]
+    ipb_range_start: Col[str]
+    ipb_range_end: Col[str]
+    ipb_deleted: Col[int] = col(SmallInteger)
+    ipb_block_email: Col[int] = col(SmallInteger)
+    ipb_allow_usertalk: Col[int] = col(SmallInteger)
+    ipb_parent_block_id: Col[int]
+    ipb_sitewide: Col[int] = col(SmallInteger)
 
 
 class IpblocksRestrictions(Base):
@@ -631,8 +873,8 @@ class Iwlinks(Base):
 
     __tablename__ = "iwlinks"
     iwl_from: Col[int] = col(primary_key=True)
-    iwl_prefix: Col[str] = col(BinaryDecoder, primary_key=True)
-    iwl_title: Col[str] = col(BinaryDecoder, primary_key=True)
+    iwl_prefix: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    iwl_title: Col[str] = col(_BINARY_DECODER, primary_key=True)
 
 
 class Job(Base):
@@ -654,16 +896,16 @@ class Job(Base):
 
     __tablename__ = "job"
     job_id: Col[int] = col(primary_key=True)
-    job_cmd: Col[str] = col(BinaryDecoder)
-    job_namespace: Col[int] = col()
-    job_title: Col[str] = col(BinaryDecoder)
-    job_timestamp: Col[str] = col(BinaryDecoder)
-    job_params: Col[str] = col(BinaryDecoder)
-    job_random: Col[int] = col()
-    job_attempts: Col[int] = col()
-    job_token: Col[str] = col(BinaryDecoder)
-    job_token_timestamp: Col[str] = col(BinaryDecoder)
-    job_sha1: Col[str] = col(BinaryDecoder)
+    job_cmd: Col[str] = col(_ASCII_DECODER)
+    job_namespace: Col[int]
+    job_title: Col[str]
+    job_timestamp: Col[str] = col(_ASCII_DECODER)
+    job_params: Col[str]
+    job_random: Col[int]
+    job_attempts: Col[int]
+    job_token: Col[str]
+    job_token_timestamp: Col[str] = col(_ASCII_DECODER)
+    job_sha1: Col[str] = col(_ASCII_DECODER)
 
 
 class L10nCache(Base):
@@ -676,9 +918,9 @@ class L10nCache(Base):
     """
 
     __tablename__ = "l10n_cache"
-    lc_lang: Col[str] = col(BinaryDecoder, primary_key=True)
-    lc_key: Col[str] = col(BinaryDecoder, primary_key=True)
-    lc_value: Col[str] = col(BinaryDecoder)
+    lc_lang: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    lc_key: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    lc_value: Col[str]
 
 
 class Langlinks(Base):
@@ -692,8 +934,8 @@ class Langlinks(Base):
 
     __tablename__ = "langlinks"
     ll_from: Col[int] = col(primary_key=True)
-    ll_lang: Col[str] = col(BinaryDecoder, primary_key=True)
-    ll_title: Col[str] = col(BinaryDecoder)
+    ll_lang: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    ll_title: Col[str]
 
 
 class Linktarget(Base):
@@ -707,8 +949,8 @@ class Linktarget(Base):
 
     __tablename__ = "linktarget"
     lt_id: Col[int] = col(primary_key=True)
-    lt_namespace: Col[int] = col()
-    lt_title: Col[str] = col(BinaryDecoder)
+    lt_namespace: Col[int]
+    lt_title: Col[str]
 
 
 class LogSearch(Base):
@@ -721,8 +963,8 @@ class LogSearch(Base):
     """
 
     __tablename__ = "log_search"
-    ls_field: Col[str] = col(BinaryDecoder, primary_key=True)
-    ls_value: Col[str] = col(BinaryDecoder, primary_key=True)
+    ls_field: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    ls_value: Col[str] = col(_BINARY_DECODER, primary_key=True)
     ls_log_id: Col[int] = col(primary_key=True)
 
 
@@ -734,27 +976,28 @@ class Logging(Base):
         log_type: ``str``
         log_action: ``str``
         log_timestamp: ``str``
-        log_actor: ``Decimal``
+        log_actor: ``int``
         log_namespace: ``int``
         log_title: ``str``
         log_page: ``int``
-        log_comment_id: ``Decimal``
+        log_comment_id: ``int``
         log_params: ``str``
         log_deleted: ``int``
     """
 
     __tablename__ = "logging"
-    log_id: Col[int] = col(primary_key=True)
-    log_type: Col[str] = col(BinaryDecoder)
-    log_action: Col[str] = col(BinaryDecoder)
-    log_timestamp: Col[str] = col(BinaryDecoder)
-    log_actor: Col[Decimal] = col()
-    log_namespace: Col[int] = col()
-    log_title: Col[str] = col(BinaryDecoder)
-    log_page: Col[int] = col()
-    log_comment_id: Col[Decimal] = col()
-    log_params: Col[str] = col(BinaryDecoder)
-    log_deleted: Col[int] = col()
+    log_id: Col[int] = col(BigInteger, primary_key=True)
+    log_type: Col[str] = col(_ASCII_DECODER)
+    log_action: Col[str] = col(_ASCII_DECODER)
+    log_timestamp: Col[str] = col(_ASCII_DECODER)
+    log_actor: Col[int] = col(_UNSIGNED_BIGINT)
+    log_namespace: Col[int]
+    log_title: Col[str]
+    log_page: Col[int]
+    log_comment_id: Col[int] = col(_UNSIGNED_BIGINT)
+    log_params: Col[str]
+    log_deleted: Col[int] = col(SmallInteger)
+    __table_args__ = (Index("type_time", "log_type", "log_timestamp"),)
 
 
 class ModuleDeps(Base):
@@ -767,9 +1010,9 @@ class ModuleDeps(Base):
     """
 
     __tablename__ = "module_deps"
-    md_module: Col[str] = col(BinaryDecoder, primary_key=True)
-    md_skin: Col[str] = col(BinaryDecoder, primary_key=True)
-    md_deps: Col[str] = col(BinaryDecoder)
+    md_module: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    md_skin: Col[str] = col(_ASCII_DECODER, primary_key=True)
+    md_deps: Col[str]
 
 
 class Objectcache(Base):
@@ -784,11 +1027,11 @@ class Objectcache(Base):
     """
 
     __tablename__ = "objectcache"
-    keyname: Col[str] = col(BinaryDecoder, primary_key=True)
-    value: Col[str] = col(BinaryDecoder)
-    exptime: Col[str] = col(BinaryDecoder)
-    modtoken: Col[str] = col(BinaryDecoder)
-    flags: Col[int] = col()
+    keyname: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    value: Col[str]
+    exptime: Col[str]
+    modtoken: Col[str]
+    flags: Col[int]
 
 
 class Oldimage(Base):
@@ -801,7 +1044,7 @@ class Oldimage(Base):
         oi_width: ``int``
         oi_height: ``int``
         oi_bits: ``int``
-        oi_description_id: ``Decimal``
+        oi_description_id: ``int``
         oi_actor: ``int``
         oi_timestamp: ``str``
         oi_metadata: ``str``
@@ -813,21 +1056,28 @@ class Oldimage(Base):
     """
 
     __tablename__ = "oldimage"
-    oi_name: Col[str] = col(BinaryDecoder, primary_key=True)
-    oi_archive_name: Col[str] = col(BinaryDecoder, primary_key=True)
+    oi_name: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    oi_archive_name: Col[str] = col(_BINARY_DECODER, primary_key=True)
     oi_size: Col[int] = col(primary_key=True)
     oi_width: Col[int] = col(primary_key=True)
     oi_height: Col[int] = col(primary_key=True)
     oi_bits: Col[int] = col(primary_key=True)
-    oi_description_id: Col[Decimal] = col(primary_key=True)
+    oi_description_id: Col[int] = col(_UNSIGNED_BIGINT, primary_key=True)
     oi_actor: Col[int] = col(primary_key=True)
-    oi_timestamp: Col[str] = col(BinaryDecoder, primary_key=True)
-    oi_metadata: Col[str] = col(BinaryDecoder, primary_key=True)
-    oi_media_type: Col[str] = col(BinaryDecoder, primary_key=True)
-    oi_major_mime: Col[str] = col(BinaryDecoder, primary_key=True)
-    oi_minor_mime: Col[str] = col(BinaryDecoder, primary_key=True)
+    oi_timestamp: Col[str] = col(_ASCII_DECODER, primary_key=True)
+    oi_metadata: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    oi_media_type: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    oi_major_mime: Col[str] = col(_ASCII_DECODER, primary_key=True)
+    oi_minor_mime: Col[str] = col(_ASCII_DECODER, primary_key=True)
     oi_deleted: Col[int] = col(primary_key=True)
-    oi_sha1: Col[str] = col(BinaryDecoder, primary_key=True)
+    oi_sha1: Col[str] = col(_ASCII_DECODER, primary_key=True)
+
+    # The table itself has no primary key, hence every column being
+    # part of the constraint above; (oi_name, oi_archive_name) is the
+    # unique pair, so the mapper identity only needs to hash those two.
+    __mapper_args__ = {  # noqa: RUF012
+        "primary_key": (oi_name, oi_archive_name),
+    }
 
 
 class Page(Base):
@@ -850,17 +1100,20 @@ class Page(Base):
 
     __tablename__ = "page"
     page_id: Col[int] = col(primary_key=True)
-    page_namespace: Col[int] = col()
-    page_title: Col[str] = col(BinaryDecoder)
-    page_is_redirect: Col[int] = col()
-    page_is_new: Col[int] = col()
-    page_random: Col[float] = col()
-    page_touched: Col[str] = col(BinaryDecoder)
-    page_links_updated: Col[str] = col(BinaryDecoder)
-    page_latest: Col[int] = col()
-    page_len: Col[int] = col()
-    page_content_model: Col[str] = col(BinaryDecoder)
-    page_lang: Col[str] = col(BinaryDecoder)
+    page_namespace: Col[int]
+    page_title: Col[str]
+    page_is_redirect: Col[int] = col(SmallInteger)
+    page_is_new: Col[int] = col(SmallInteger)
+    page_random: Col[float]
+    page_touched: Col[str]
+    page_links_updated: Col[str]
+    page_latest: Col[int]
+    page_len: Col[int]
+    page_content_model: Col[str] = col(_ASCII_DECODER)
+    page_lang: Col[str]
+    __table_args__ = (
+        Index("page_name_title", "page_namespace", "page_title", unique=True),
+    )
 
 
 class PageProps(Base):
@@ -875,9 +1128,9 @@ class PageProps(Base):
 
     __tablename__ = "page_props"
     pp_page: Col[int] = col(primary_key=True)
-    pp_propname: Col[str] = col(BinaryDecoder, primary_key=True)
-    pp_value: Col[str] = col(BinaryDecoder)
-    pp_sortkey: Col[float] = col()
+    pp_propname: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    pp_value: Col[str]
+    pp_sortkey: Col[float]
 
 
 class PageRestrictions(Base):
@@ -894,11 +1147,11 @@ class PageRestrictions(Base):
 
     __tablename__ = "page_restrictions"
     pr_id: Col[int] = col(primary_key=True)
-    pr_page: Col[int] = col()
-    pr_type: Col[str] = col(BinaryDecoder)
-    pr_level: Col[str] = col(BinaryDecoder)
-    pr_cascade: Col[int] = col()
-    pr_expiry: Col[str] = col(BinaryDecoder)
+    pr_page: Col[int]
+    pr_type: Col[str]
+    pr_level: Col[str]
+    pr_cascade: Col[int] = col(SmallInteger)
+    pr_expiry: Col[str]
 
 
 class Pagelinks(Base):
@@ -912,8 +1165,8 @@ class Pagelinks(Base):
 
     __tablename__ = "pagelinks"
     pl_from: Col[int] = col(primary_key=True)
-    pl_from_namespace: Col[int] = col()
-    pl_target_id: Col[int] = col()
+    pl_from_namespace: Col[int]
+    pl_target_id: Col[int]
 
 
 class ProtectedTitles(Base):
@@ -931,12 +1184,12 @@ class ProtectedTitles(Base):
 
     __tablename__ = "protected_titles"
     pt_namespace: Col[int] = col(primary_key=True)
-    pt_title: Col[str] = col(BinaryDecoder, primary_key=True)
-    pt_user: Col[int] = col()
-    pt_reason_id: Col[int] = col()
-    pt_timestamp: Col[str] = col(BinaryDecoder)
-    pt_expiry: Col[str] = col(BinaryDecoder)
-    pt_create_perm: Col[str] = col(BinaryDecoder)
+    pt_title: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    pt_user: Col[int]
+    pt_reason_id: Col[int]
+    pt_timestamp: Col[str] = col(_ASCII_DECODER)
+    pt_expiry: Col[str]
+    pt_create_perm: Col[str]
 
 
 class Querycache(Base):
@@ -950,10 +1203,10 @@ class Querycache(Base):
     """
 
     __tablename__ = "querycache"
-    qc_type: Col[str] = col(BinaryDecoder, primary_key=True)
+    qc_type: Col[str] = col(_BINARY_DECODER, primary_key=True)
     qc_value: Col[int] = col(primary_key=True)
     qc_namespace: Col[int] = col(primary_key=True)
-    qc_title: Col[str] = col(BinaryDecoder, primary_key=True)
+    qc_title: Col[str] = col(_BINARY_DECODER, primary_key=True)
 
 
 class QuerycacheInfo(Base):
@@ -965,8 +1218,8 @@ class QuerycacheInfo(Base):
     """
 
     __tablename__ = "querycache_info"
-    qci_type: Col[str] = col(BinaryDecoder, primary_key=True)
-    qci_timestamp: Col[str] = col(BinaryDecoder)
+    qci_type: Col[str] = col(_ASCII_DECODER, primary_key=True)
+    qci_timestamp: Col[str] = col(_ASCII_DECODER)
 
 
 class Querycachetwo(Base):
@@ -982,12 +1235,12 @@ class Querycachetwo(Base):
     """
 
     __tablename__ = "querycachetwo"
-    qcc_type: Col[str] = col(BinaryDecoder, primary_key=True)
+    qcc_type: Col[str] = col(_BINARY_DECODER, primary_key=True)
     qcc_value: Col[int] = col(primary_key=True)
     qcc_namespace: Col[int] = col(primary_key=True)
-    qcc_title: Col[str] = col(BinaryDecoder, primary_key=True)
+    qcc_title: Col[str] = col(_BINARY_DECODER, primary_key=True)
     qcc_namespacetwo: Col[int] = col(primary_key=True)
-    qcc_titletwo: Col[str] = col(BinaryDecoder, primary_key=True)
+    qcc_titletwo: Col[str] = col(_BINARY_DECODER, primary_key=True)
 
 
 class Recentchanges(Base):
@@ -996,7 +1249,7 @@ class Recentchanges(Base):
     Attributes:
         rc_id: ``int``
         rc_timestamp: ``str``
-        rc_actor: ``Decimal``
+        rc_actor: ``int``
         rc_namespace: ``int``
         rc_title: ``str``
         rc_comment_id: ``int``
@@ -1020,29 +1273,30 @@ class Recentchanges(Base):
     """
 
     __tablename__ = "recentchanges"
-    rc_id: Col[int] = col(primary_key=True)
-    rc_timestamp: Col[str] = col(BinaryDecoder)
-    rc_actor: Col[Decimal] = col()
-    rc_namespace: Col[int] = col()
-    rc_title: Col[str] = col(BinaryDecoder)
-    rc_comment_id: Col[int] = col()
-    rc_minor: Col[int] = col()
-    rc_bot: Col[int] = col()
-    rc_new: Col[int] = col()
-    rc_cur_id: Col[int] = col()
-    rc_this_oldid: Col[int] = col()
-    rc_last_oldid: Col[int] = col()
-    rc_type: Col[int] = col()
-    rc_source: Col[str] = col(BinaryDecoder)
-    rc_patrolled: Col[int] = col()
-    rc_ip: Col[str] = col(BinaryDecoder)
-    rc_old_len: Col[int] = col()
-    rc_new_len: Col[int] = col()
-    rc_deleted: Col[int] = col()
-    rc_logid: Col[int] = col()
-    rc_log_type: Col[str] = col(BinaryDecoder)
-    rc_log_action: Col[str] = col(BinaryDecoder)
-    rc_params: Col[str] = col(BinaryDecoder)
+    rc_id: Col[int] = col(BigInteger, primary_key=True)
+    rc_timestamp: Col[str] = col(_ASCII_DECODER)
+    rc_actor: Col[int] = col(_UNSIGNED_BIGINT)
+    rc_namespace: Col[int]
+    rc_title: Col[str]
+    rc_comment_id: Col[int]
+    rc_minor: Col[int] = col(SmallInteger)
+    rc_bot: Col[int] = col(SmallInteger)
+    rc_new: Col[int] = col(SmallInteger)
+    rc_cur_id: Col[int]
+    rc_this_oldid: Col[int]
+    rc_last_oldid: Col[int]
+    rc_type: Col[int] = col(SmallInteger)
+    rc_source: Col[str] = col(_ASCII_DECODER)
+    rc_patrolled: Col[int] = col(SmallInteger)
+    rc_ip: Col[str]
+    rc_old_len: Col[int]
+    rc_new_len: Col[int]
+    rc_deleted: Col[int] = col(SmallInteger)
+    rc_logid: Col[int]
+    rc_log_type: Col[str]
+    rc_log_action: Col[str]
+    rc_params: Col[str]
+    __table_args__ = (Index("rc_timestamp", "rc_timestamp"),)
 
 
 class Redirect(Base):
@@ -1058,10 +1312,10 @@ class Redirect(Base):
 
     __tablename__ = "redirect"
     rd_from: Col[int] = col(primary_key=True)
-    rd_namespace: Col[int] = col()
-    rd_title: Col[str] = col(BinaryDecoder)
-    rd_interwiki: Col[str] = col(BinaryDecoder)
-    rd_fragment: Col[str] = col(BinaryDecoder)
+    rd_namespace: Col[int]
+    rd_title: Col[str]
+    rd_interwiki: Col[str]
+    rd_fragment: Col[str]
 
 
 class Revision(Base):
@@ -1081,16 +1335,17 @@ class Revision(Base):
     """
 
     __tablename__ = "revision"
-    rev_id: Col[int] = col(primary_key=True)
-    rev_page: Col[int] = col()
-    rev_comment_id: Col[int] = col()
-    rev_actor: Col[int] = col()
-    rev_timestamp: Col[str] = col(BinaryDecoder)
-    rev_minor_edit: Col[int] = col()
-    rev_deleted: Col[int] = col()
-    rev_len: Col[int] = col()
-    rev_parent_id: Col[int] = col()
-    rev_sha1: Col[str] = col(BinaryDecoder)
+    rev_id: Col[int] = col(BigInteger, primary_key=True)
+    rev_page: Col[int]
+    rev_comment_id: Col[int]
+    rev_actor: Col[int]
+    rev_timestamp: Col[str] = col(_ASCII_DECODER)
+    rev_minor_edit: Col[int] = col(SmallInteger)
+    rev_deleted: Col[int] = col(SmallInteger)
+    rev_len: Col[int]
+    rev_parent_id: Col[int]
+    rev_sha1: Col[str] = col(_ASCII_DECODER)
+    __table_args__ = (Index("page_timestamp", "rev_page", "rev_timestamp"),)
 
 
 class Searchindex(Base):
@@ -1104,8 +1359,8 @@ class Searchindex(Base):
 
     __tablename__ = "searchindex"
     si_page: Col[int] = col(primary_key=True)
-    si_title: Col[str] = col(BinaryDecoder)
-    si_text: Col[str] = col(BinaryDecoder)
+    si_title: Col[str]
+    si_text: Col[str]
 
 
 class SiteIdentifiers(Base):
@@ -1118,9 +1373,9 @@ class SiteIdentifiers(Base):
     """
 
     __tablename__ = "site_identifiers"
-    si_type: Col[str] = col(BinaryDecoder, primary_key=True)
-    si_key: Col[str] = col(BinaryDecoder, primary_key=True)
-    si_site: Col[int] = col()
+    si_type: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    si_key: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    si_site: Col[int]
 
 
 class SiteStats(Base):
@@ -1138,12 +1393,12 @@ class SiteStats(Base):
 
     __tablename__ = "site_stats"
     ss_row_id: Col[int] = col(primary_key=True)
-    ss_total_edits: Col[int] = col()
-    ss_good_articles: Col[int] = col()
-    ss_total_pages: Col[int] = col()
-    ss_users: Col[int] = col()
-    ss_active_users: Col[int] = col()
-    ss_images: Col[int] = col()
+    ss_total_edits: Col[int]
+    ss_good_articles: Col[int]
+    ss_total_pages: Col[int]
+    ss_users: Col[int]
+    ss_active_users: Col[int]
+    ss_images: Col[int]
 
 
 class Sites(Base):
@@ -1165,16 +1420,16 @@ class Sites(Base):
 
     __tablename__ = "sites"
     site_id: Col[int] = col(primary_key=True)
-    site_global_key: Col[str] = col(BinaryDecoder)
-    site_type: Col[str] = col(BinaryDecoder)
-    site_group: Col[str] = col(BinaryDecoder)
-    site_source: Col[str] = col(BinaryDecoder)
-    site_language: Col[str] = col(BinaryDecoder)
-    site_protocol: Col[str] = col(BinaryDecoder)
-    site_domain: Col[str] = col(BinaryDecoder)
-    site_data: Col[str] = col(BinaryDecoder)
-    site_forward: Col[int] = col()
-    site_config: Col[str] = col(BinaryDecoder)
+    site_global_key: Col[str]
+    site_type: Col[str]
+    site_group: Col[str]
+    site_source: Col[str]
+    site_language: Col[str]
+    site_protocol: Col[str]
+    site_domain: Col[str]
+    site_data: Col[str]
+    site_forward: Col[int]
+    site_config: Col[str]
 
 
 class SlotRoles(Base):
@@ -1187,7 +1442,7 @@ class SlotRoles(Base):
 
     __tablename__ = "slot_roles"
     role_id: Col[int] = col(primary_key=True)
-    role_name: Col[str] = col(BinaryDecoder)
+    role_name: Col[str]
 
 
 class Slots(Base):
@@ -1203,8 +1458,8 @@ class Slots(Base):
     __tablename__ = "slots"
     slot_revision_id: Col[int] = col(primary_key=True)
     slot_role_id: Col[int] = col(primary_key=True)
-    slot_content_id: Col[int] = col()
-    slot_origin: Col[int] = col()
+    slot_content_id: Col[int]
+    slot_origin: Col[int]
 
 
 class Templatelinks(Base):
@@ -1218,7 +1473,7 @@ class Templatelinks(Base):
 
     __tablename__ = "templatelinks"
     tl_from: Col[int] = col(primary_key=True)
-    tl_from_namespace: Col[int] = col()
+    tl_from_namespace: Col[int]
     tl_target_id: Col[int] = col(primary_key=True)
 
 
@@ -1233,8 +1488,8 @@ class Text(Base):
 
     __tablename__ = "text"
     old_id: Col[int] = col(primary_key=True)
-    old_text: Col[str] = col(BinaryDecoder)
-    old_flags: Col[str] = col(BinaryDecoder)
+    old_text: Col[str]
+    old_flags: Col[str]
 
 
 class Updatelog(Base):
@@ -1246,8 +1501,8 @@ class Updatelog(Base):
     """
 
     __tablename__ = "updatelog"
-    ul_key: Col[str] = col(BinaryDecoder, primary_key=True)
-    ul_value: Col[str] = col(BinaryDecoder)
+    ul_key: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    ul_value: Col[str]
 
 
 class Uploadstash(Base):
@@ -1275,22 +1530,22 @@ class Uploadstash(Base):
 
     __tablename__ = "uploadstash"
     us_id: Col[int] = col(primary_key=True)
-    us_user: Col[int] = col()
-    us_key: Col[str] = col(BinaryDecoder)
-    us_orig_path: Col[str] = col(BinaryDecoder)
-    us_path: Col[str] = col(BinaryDecoder)
-    us_source_type: Col[str] = col(BinaryDecoder)
-    us_timestamp: Col[str] = col(BinaryDecoder)
-    us_status: Col[str] = col(BinaryDecoder)
-    us_chunk_inx: Col[int] = col()
-    us_props: Col[str] = col(BinaryDecoder)
-    us_size: Col[int] = col()
-    us_sha1: Col[str] = col(BinaryDecoder)
-    us_mime: Col[str] = col(BinaryDecoder)
-    us_media_type: Col[str] = col(BinaryDecoder)
-    us_image_width: Col[int] = col()
-    us_image_height: Col[int] = col()
-    us_image_bits: Col[int] = col()
+    us_user: Col[int]
+    us_key: Col[str]
+    us_orig_path: Col[str]
+    us_path: Col[str]
+    us_source_type: Col[str]
+    us_timestamp: Col[str] = col(_ASCII_DECODER)
+    us_status: Col[str]
+    us_chunk_inx: Col[int]
+    us_props: Col[str]
+    us_size: Col[int]
+    us_sha1: Col[str] = col(_ASCII_DECODER)
+    us_mime: Col[str] = col(_ASCII_DECODER)
+    us_media_type: Col[str]
+    us_image_width: Col[int]
+    us_image_height: Col[int]
+    us_image_bits: Col[int]
 
 
 class User(Base):
@@ -1317,21 +1572,21 @@ class User(Base):
 
     __tablename__ = "user"
     user_id: Col[int] = col(primary_key=True)
-    user_name: Col[str] = col(BinaryDecoder)
-    user_real_name: Col[str] = col(BinaryDecoder)
-    user_password: Col[str] = col(BinaryDecoder)
-    user_newpassword: Col[str] = col(BinaryDecoder)
-    user_newpass_time: Col[str] = col(BinaryDecoder)
-    user_email: Col[str] = col(BinaryDecoder)
-    user_touched: Col[str] = col(BinaryDecoder)
-    user_token: Col[str] = col(BinaryDecoder)
-    user_email_authenticated: Col[str] = col(BinaryDecoder)
-    user_email_token: Col[str] = col(BinaryDecoder)
-    user_email_token_expires: Col[str] = col(BinaryDecoder)
-    user_registration: Col[str] = col(BinaryDecoder)
-    user_editcount: Col[int] = col()
-    user_password_expires: Col[str] = col(BinaryDecoder)
-    user_is_temp: Col[int] = col()
+    user_name: Col[str]
+    user_real_name: Col[str]
+    user_password: Col[str]
+    user_newpassword: Col[str]
+    user_newpass_time: Col[str]
+    user_email: Col[str]
+    user_touched: Col[str]
+    user_token: Col[str]
+    user_email_authenticated: Col[str]
+    user_email_token: Col[str]
+    user_email_token_expires: Col[str]
+    user_registration: Col[str]
+    user_editcount: Col[int]
+    user_password_expires: Col[str]
+    user_is_temp: Col[int]
 
 
 class UserAutocreateSerial(Base):
@@ -1346,7 +1601,7 @@ class UserAutocreateSerial(Base):
     __tablename__ = "user_autocreate_serial"
     uas_shard: Col[int] = col(primary_key=True)
     uas_year: Col[int] = col(primary_key=True)
-    uas_value: Col[int] = col()
+    uas_value: Col[int]
 
 
 class UserFormerGroups(Base):
@@ -1359,7 +1614,7 @@ class UserFormerGroups(Base):
 
     __tablename__ = "user_former_groups"
     ufg_user: Col[int] = col(primary_key=True)
-    ufg_group: Col[str] = col(BinaryDecoder, primary_key=True)
+    ufg_group: Col[str] = col(_BINARY_DECODER, primary_key=True)
 
 
 class UserGroups(Base):
@@ -1373,8 +1628,8 @@ class UserGroups(Base):
 
     __tablename__ = "user_groups"
     ug_user: Col[int] = col(primary_key=True)
-    ug_group: Col[str] = col(BinaryDecoder, primary_key=True)
-    ug_expiry: Col[str] = col(BinaryDecoder)
+    ug_group: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    ug_expiry: Col[str]
 
 
 class UserNewtalk(Base):
@@ -1388,8 +1643,8 @@ class UserNewtalk(Base):
 
     __tablename__ = "user_newtalk"
     user_id: Col[int] = col(primary_key=True)
-    user_ip: Col[str] = col(BinaryDecoder, primary_key=True)
-    user_last_timestamp: Col[str] = col(BinaryDecoder, primary_key=True)
+    user_ip: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    user_last_timestamp: Col[str] = col(_ASCII_DECODER, primary_key=True)
 
 
 class UserProperties(Base):
@@ -1403,8 +1658,8 @@ class UserProperties(Base):
 
     __tablename__ = "user_properties"
     up_user: Col[int] = col(primary_key=True)
-    up_property: Col[str] = col(BinaryDecoder, primary_key=True)
-    up_value: Col[str] = col(BinaryDecoder)
+    up_property: Col[str] = col(_BINARY_DECODER, primary_key=True)
+    up_value: Col[str]
 
 
 class Watchlist(Base):
@@ -1420,10 +1675,10 @@ class Watchlist(Base):
 
     __tablename__ = "watchlist"
     wl_id: Col[int] = col(primary_key=True)
-    wl_user: Col[int] = col()
-    wl_namespace: Col[int] = col()
-    wl_title: Col[str] = col(BinaryDecoder)
-    wl_notificationtimestamp: Col[str] = col(BinaryDecoder)
+    wl_user: Col[int]
+    wl_namespace: Col[int]
+    wl_title: Col[str]
+    wl_notificationtimestamp: Col[str]
 
 
 class WatchlistExpiry(Base):
@@ -1436,7 +1691,7 @@ class WatchlistExpiry(Base):
 
     __tablename__ = "watchlist_expiry"
     we_item: Col[int] = col(primary_key=True)
-    we_expiry: Col[str] = col(BinaryDecoder)
+    we_expiry: Col[str]
 
 
 class WbChanges(Base):
@@ -1454,12 +1709,12 @@ class WbChanges(Base):
 
     __tablename__ = "wb_changes"
     change_id: Col[int] = col(primary_key=True)
-    change_type: Col[str] = col(BinaryDecoder)
-    change_time: Col[str] = col(BinaryDecoder)
-    change_object_id: Col[str] = col(BinaryDecoder)
-    change_revision_id: Col[int] = col()
-    change_user_id: Col[int] = col()
-    change_info: Col[str] = col(BinaryDecoder)
+    change_type: Col[str]
+    change_time: Col[str]
+    change_object_id: Col[str]
+    change_revision_id: Col[int]
+    change_user_id: Col[int]
+    change_info: Col[str]
 
 
 class WbChangesSubscription(Base):
@@ -1473,8 +1728,8 @@ class WbChangesSubscription(Base):
 
     __tablename__ = "wb_changes_subscription"
     cs_row_id: Col[int] = col(primary_key=True)
-    cs_entity_id: Col[str] = col(BinaryDecoder)
-    cs_subscriber_id: Col[str] = col(BinaryDecoder)
+    cs_entity_id: Col[str]
+    cs_subscriber_id: Col[str]
 
 
 class WbIdCounters(Base):
@@ -1487,7 +1742,7 @@ class WbIdCounters(Base):
 
     __tablename__ = "wb_id_counters"
     id_value: Col[int] = col(primary_key=True)
-    id_type: Col[str] = col(BinaryDecoder, primary_key=True)
+    id_type: Col[str] = col(_BINARY_DECODER, primary_key=True)
 
 
 class WbItemsPerSite(Base):
@@ -1502,9 +1757,9 @@ class WbItemsPerSite(Base):
 
     __tablename__ = "wb_items_per_site"
     ips_row_id: Col[int] = col(primary_key=True)
-    ips_item_id: Col[int] = col()
-    ips_site_id: Col[str] = col(BinaryDecoder)
-    ips_site_page: Col[str] = col(BinaryDecoder)
+    ips_item_id: Col[int]
+    ips_site_id: Col[str]
+    ips_site_page: Col[str]
 
 
 class WbPropertyInfo(Base):
@@ -1518,8 +1773,8 @@ class WbPropertyInfo(Base):
 
     __tablename__ = "wb_property_info"
     pi_property_id: Col[int] = col(primary_key=True)
-    pi_type: Col[str] = col(BinaryDecoder)
-    pi_info: Col[str] = col(BinaryDecoder)
+    pi_type: Col[str]
+    pi_info: Col[str]
 
 
 class WbtItemTerms(Base):
@@ -1533,8 +1788,8 @@ class WbtItemTerms(Base):
 
     __tablename__ = "wbt_item_terms"
     wbit_id: Col[int] = col(primary_key=True)
-    wbit_item_id: Col[int] = col()
-    wbit_term_in_lang_id: Col[int] = col()
+    wbit_item_id: Col[int]
+    wbit_term_in_lang_id: Col[int]
 
 
 class WbtPropertyTerms(Base):
@@ -1548,8 +1803,8 @@ class WbtPropertyTerms(Base):
 
     __tablename__ = "wbt_property_terms"
     wbpt_id: Col[int] = col(primary_key=True)
-    wbpt_property_id: Col[int] = col()
-    wbpt_term_in_lang_id: Col[int] = col()
+    wbpt_property_id: Col[int]
+    wbpt_term_in_lang_id: Col[int]
 
 
 class WbtTermInLang(Base):
@@ -1563,8 +1818,8 @@ class WbtTermInLang(Base):
 
     __tablename__ = "wbt_term_in_lang"
     wbtl_id: Col[int] = col(primary_key=True)
-    wbtl_type_id: Col[int] = col()
-    wbtl_text_in_lang_id: Col[int] = col()
+    wbtl_type_id: Col[int]
+    wbtl_text_in_lang_id: Col[int]
 
 
 class WbtTextInLang(Base):
@@ -1578,8 +1833,8 @@ class WbtTextInLang(Base):
 
     __tablename__ = "wbt_text_in_lang"
     wbxl_id: Col[int] = col(primary_key=True)
-    wbxl_language: Col[str] = col(BinaryDecoder)
-    wbxl_text_id: Col[int] = col()
+    wbxl_language: Col[str]
+    wbxl_text_id: Col[int]
 
 
 class WbtType(Base):
@@ -1592,7 +1847,7 @@ class WbtType(Base):
 
     __tablename__ = "wbt_type"
     wby_id: Col[int] = col(primary_key=True)
-    wby_name: Col[str] = col(BinaryDecoder)
+    wby_name: Col[str]
 
 
 class WbtText(Base):
@@ -1605,7 +1860,7 @@ class WbtText(Base):
 
     __tablename__ = "wbt_text"
     wbx_id: Col[int] = col(primary_key=True)
-    wbx_text: Col[str] = col(BinaryDecoder)
+    wbx_text: Col[str]
 
 
 class PageAssessments(Base):
@@ -1622,9 +1877,9 @@ class PageAssessments(Base):
     __tablename__ = "page_assessments"
     pa_page_id: Col[int] = col(primary_key=True)
     pa_project_id: Col[int] = col(primary_key=True)
-    pa_class: Col[str] = col(BinaryDecoder)
-    pa_importance: Col[str] = col(BinaryDecoder)
-    pa_page_revision: Col[int] = col()
+    pa_class: Col[str]
+    pa_importance: Col[str]
+    pa_page_revision: Col[int]
 
 
 class PageAssessmentsProjects(Base):
@@ -1638,5 +1893,5 @@ class PageAssessmentsProjects(Base):
 
     __tablename__ = "page_assessments_projects"
     pap_project_id: Col[int] = col(primary_key=True)
-    pap_project_title: Col[str] = col(BinaryDecoder)
-    pap_parent_id: Col[int] = col()
+    pap_project_title: Col[str]
+    pap_parent_id: Col[int]
@@ -13,7 +13,12 @@ from __future__ import annotations
 __all__ = ("AzusaTags",)
 
 import re
-from typing import ClassVar, Literal, Self
+from sys import intern
+from typing import TYPE_CHECKING, ClassVar, Self
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 
 class AzusaTags:
@@ -34,13 +39,44 @@ class AzusaTags:
         'neko'
         >>> foo_tags.replace_content(t, "inu")
         '<!-- azusa start="foo" -->inu<!-- azusa end="foo" -->'
-    """
 
-    __slots__ = ("name",)
-
-    _instances: ClassVar[dict[str, Self]] = {}
+    Attributes:
+        name: The tag identifier (e.g., "foo").
+        start: The opening comment tag for the name.
+        end: The closing comment tag for the name.
+        start_bytes: The opening tag encoded as UTF-8 bytes.
+        end_bytes: The closing tag encoded as UTF-8 bytes.
+        section_pattern: A compiled regex matching the entire section
+            and capturing everything between the start and end tags.
+    """
 
-    _TAG_TEMPLATE = '<!-- azusa {pos}="{name}" -->'
+    # The __weakref__ slot lets the instance cache hold weak
+    # references, so unused tag objects stay collectable.
+    __slots__ = (
+        "__weakref__",
+        "end",
+        "end_bytes",
+        "name",
+        "section_pattern",
+        "start",
+        "start_bytes",
+    )
+
+    name: str
+    start: str
+    end: str
+    start_bytes: bytes
+    end_bytes: bytes
+    section_pattern: re.Pattern[str]
+
+    _instances: ClassVar[WeakValueDictionary[str, Self]] = (
+        WeakValueDictionary()
+    )
+
+    _ANY_SECTION_PATTERN = re.compile(
+        r'<!-- azusa start="([^"]+)" -->(.*?)<!-- azusa end="\1" -->',
+        flags=re.DOTALL,
+    )
 
     def __new__(cls, name: str) -> Self:
         """Create or return a cached instance for the given name.
@@ -51,60 +87,82 @@ class AzusaTags:
         Returns:
             The corresponding tag instance (newed or cached).
         """
-        return cls._instances.setdefault(name, super().__new__(cls))
+        # Interned names give cache lookups the pointer-equality fast
+        # path; tag names are short identifiers, so this is safe.
+        return cls._instances.setdefault(intern(name), super().__new__(cls))
 
     def __init__(self, name: str) -> None:
         """Initialize a new instance.
 
+        Cached instances returned by __new__ skip re-initialization,
+        so the tag strings and the section pattern are built only once
+        per name.
+
         Args:
             name: The name used in the start and end tags.
         """
-        self.name = name
-
-    def _tag(self, pos: Literal["start", "end"]) -> str:
-        """Generate a comment tag string for the given position.
+        if hasattr(self, "name"):
+            # Cached instance returned by __new__; already initialized.
+            return
+        self.name = intern(name)
+        self.start = f'<!-- azusa start="{name}" -->'
+        self.end = f'<!-- azusa end="{name}" -->'
+        self.start_bytes = self.start.encode()
+        self.end_bytes = self.end.encode()
+        ptn_str = (
+            rf"{re.escape(self.start)}"
+            r"(.*?)"
+            rf"{re.escape(self.end)}"
+        )
+        self.section_pattern = re.compile(ptn_str, flags=re.DOTALL)
 
-        Args:
-            pos: The position of the tag. One of 'start' or 'end'.
+    @classmethod
+    def iter_all(cls, text: str) -> Iterator[tuple[str, str, tuple[int, int]]]:
+        """Iterate over every azusa section in the text, of any name.
 
-        Returns:
-            The full comment tag string.
-        """
-        return self._TAG_TEMPLATE.format(pos=pos, name=self.name)
+        A single class-level pattern matches all section names at once,
+        so batch consumers can collect many sections in one scan of the
+        document instead of one scan per tag name.
 
-    @property
-    def start(self) -> str:
-        """Get the opening comment tag for the current name.
+        Args:
+            text: The text to scan for sections.
 
-        Returns:
-            The start tag, e.g., '<!-- azusa start="foo" -->'.
+        Yields:
+            One (name, content, span) tuple per section in document
+            order, where span is the (start, end) index pair of the
+            entire section within the text.
         """
-        return self._tag("start")
-
-    @property
-    def end(self) -> str:
-        """Get the closing comment tag for the current name.
+        for match in cls._ANY_SECTION_PATTERN.finditer(text):
+            yield match.group(1), match.group(2), match.span()
 
-        Returns:
-            The end tag, e.g., '<!-- azusa end="foo" -->'.
-        """
-        return self._tag("end")
+    @classmethod
+    def extract_many(
+        cls,
+        text: str,
+        tags: Iterable[Self],
+    ) -> dict[str, str]:
+        """Extract the first section of each given tag in one scan.
 
-    @property
-    def section_pattern(self) -> re.Pattern:
-        """Get a compiled regex pattern to match the entire section.
+        A single pass of the any-name pattern (see :meth:`iter_all`)
+        covers every requested tag, instead of re-scanning the whole
+        document once per name.
 
-        The pattern captures everything between the start and end tags.
+        Args:
+            text: The text to scan for sections.
+            tags: The tags whose section contents should be extracted.
 
         Returns:
-            A compiled regular expression for section extraction.
+            A mapping from tag name to the content of its first
+            section. Names without a section in the text are absent.
         """
-        ptn_str = (
-            rf"{re.escape(self.start)}"
-            r"(.*?)"
-            rf"{re.escape(self.end)}"
-        )
-        return re.compile(ptn_str, flags=re.DOTALL)
+        wanted = {tag.name for tag in tags}
+        contents: dict[str, str] = {}
+        for name, content, _ in cls.iter_all(text):
+            if name in wanted and name not in contents:
+                contents[name] = content
+                if len(contents) == len(wanted):
+                    break
+        return contents
 
     def make_section(self, content: str = "") -> str:
         """Construct a section with two tags around the given content.
@@ -115,7 +173,7 @@ class AzusaTags:
         Returns:
             The formatted section string.
         """
-        return f"{self.start}{content}{self.end}"
+        return self.start + content + self.end
 
     def extract_content(self, text: str) -> str | None:
         """Extract the inner content of the section from the text.
@@ -131,9 +189,38 @@ class AzusaTags:
             The content inside the first section if found, otherwise
             None.
         """
-        if matches := self.section_pattern.search(text):
-            return matches.group(1)
-        return None
+        i = text.find(self.start)
+        if i == -1:
+            return None
+        i += len(self.start)
+        j = text.find(self.end, i)
+        if j == -1:
+            return None
+        return text[i:j]
+
+    def extract_content_bytes(self, raw: bytes) -> bytes | None:
+        """Extract the inner content of the section from UTF-8 bytes.
+
+        This is the bytes counterpart of :meth:`extract_content` for
+        wikitext that arrives as UTF-8 from the network or a dump.
+        Searching the raw bytes avoids decoding the whole document;
+        callers decode only the returned slice.
+
+        Args:
+            raw: The UTF-8 encoded text to search.
+
+        Returns:
+            The raw content inside the first section if found,
+            otherwise None.
+        """
+        i = raw.find(self.start_bytes)
+        if i == -1:
+            return None
+        i += len(self.start_bytes)
+        j = raw.find(self.end_bytes, i)
+        if j == -1:
+            return None
+        return raw[i:j]
 
     def replace_content(self, text: str, new: str, *, count: int = 0) -> str:
         """Replace the content inside the section with new content.
@@ -153,5 +240,21 @@ class AzusaTags:
         Returns:
             str: The updated text with the content replaced.
         """
-        new_content = self.make_section(new)
-        return self.section_pattern.sub(new_content, text, count=count)
+        start, end = self.start, self.end
+        parts = []
+        pos = 0
+        replaced = 0
+        while count == 0 or replaced < count:
+            i = text.find(start, pos)
+            if i == -1:
+                break
+            j = text.find(end, i + len(start))
+            if j == -1:
+                break
+            parts.extend((text[pos:i], start, new, end))
+            pos = j + len(end)
+            replaced += 1
+        if not parts:
+            return text
+        parts.append(text[pos:])
+        return "".join(parts)